@@ -8,24 +8,61 @@ Supports wallet management, transaction handling, tokenization, and event listen
 Dependencies:
     - Python 3.7+
     - aiohttp (install via pip: pip install aiohttp)
+    - orjson (install via pip: pip install orjson)
+    - uvloop (optional, faster event loop on Linux/macOS: pip install uvloop)
+    - rloop (optional, experimental Linux event loop when Config.USE_RLOOP is set: pip install rloop)
+    - coincurve (secp256k1 keys via libsecp256k1, required for wallet addresses and signing: pip install coincurve)
+    - httpx (optional, HTTP/2 transport when Config.USE_HTTP2 is set: pip install "httpx[http2]")
 """
 
 # 📌 Import Required Libraries
 import asyncio
 import aiohttp
+import concurrent.futures
+import contextlib
+import email.utils
+import functools
+import hashlib
+import hmac
 import logging
+import math
+import orjson
+import os
+import random
+import secrets
+import ssl
+import sys
 import time
-from typing import Callable, Optional
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Awaitable, Callable, List, Optional, Tuple, Union
+
+try:
+    import coincurve
+except ImportError:  # Wallets cannot derive addresses or child keys; signing falls back to a placeholder
+    coincurve = None
+
+try:
+    import httpx
+except ImportError:  # Config.USE_HTTP2 falls back to the aiohttp transport
+    httpx = None
 
 # ========================================================================
 # 🔹 Logging Configuration
 # ========================================================================
 logging.basicConfig(
-    level=logging.DEBUG,
+    level=logging.INFO,
     format="%(asctime)s - %(levelname)s - %(message)s"
 )
 logger = logging.getLogger("DigiplayGamingSDK")
 
+# Bound once so the request/response hot path skips the module attribute lookup
+_DUMPS = orjson.dumps
+_LOADS = orjson.loads
+
+def _now_s() -> int:
+    """Current Unix time in whole seconds, computed in integer math (no float round-trip)."""
+    return time.time_ns() // 1_000_000_000
+
 # ========================================================================
 # 🔹 Global Configuration
 # ========================================================================
@@ -33,90 +70,644 @@ class Config:
     """Global settings for the SDK."""
     DIGIBYTE_API_URL = "https://api.digibyte.io"  # Update if using a private node
     NETWORK = "mainnet"  # Options: "mainnet" or "testnet"
-    RETRY_ATTEMPTS = 3
-    RETRY_DELAY = 3  # Seconds between retry attempts
-    EVENT_POLL_INTERVAL = 10  # Seconds between event polling
+    RETRY_ATTEMPTS = 5
+    RETRY_BASE_DELAY = 0.5  # Seconds before the first retry; doubles on each attempt
+    RETRY_MAX_DELAY = 4  # Upper bound (seconds) for a single backoff step
+    RETRY_JITTER = 0.1  # Max random seconds added to each backoff step
+    RETRY_DEADLINE = 10  # Total seconds a request may spend retrying
+    RATE_LIMIT_MAX_WAIT = 60  # Longest back-off (seconds) honoured from a node's Retry-After / X-RateLimit-Reset
+    EVENT_WAIT_TIMEOUT = 30  # Seconds a long-poll waits for new events (also the WebSocket heartbeat)
+    EVENT_RECONNECT_DELAY = 5  # Seconds to wait before re-subscribing after a dropped event stream
+    HTTP_TIMEOUT = 10  # Total seconds allowed per HTTP request
+    CONNECTION_LIMIT = 100  # Max pooled connections across all hosts
+    CONNECTION_LIMIT_PER_HOST = 64  # Max pooled connections to a single node
+    KEEPALIVE_TIMEOUT = 75  # Seconds an idle connection is kept open for reuse
+    DNS_CACHE_TTL = 300  # Seconds resolved node addresses are cached
+    USE_HTTP2 = False  # Multiplex requests over HTTP/2 via httpx (event streaming then uses long-polling)
+    USE_RLOOP = False  # Prefer the experimental rloop event loop on Linux (plain-HTTP nodes only; no TLS support)
+    BROADCAST_CONCURRENCY = 64  # Broadcast worker tasks (max in-flight broadcasts)
+    TX_QUEUE_SIZE = 10_000  # Max signed transactions waiting for a broadcast worker
+    SIGN_OFFLOAD_THRESHOLD = 100  # Batches larger than this are signed in the signer process pool
+    SIGNER_PROCESSES = None  # Signer pool size; None uses one process per CPU
+
+# ========================================================================
+# 🔹 Data Models
+# ========================================================================
+# Records use explicit __slots__ (rather than dataclass(slots=True), which needs
+# Python 3.10) so each instance is a compact object with no per-instance dict.
+
+@dataclass
+class Transaction:
+    """A DigiByte payment. `signature` is empty until the transaction is signed."""
+    __slots__ = ("from_", "to", "amount", "fee", "timestamp", "signature")
+    from_: str
+    to: str
+    amount: float
+    fee: float
+    timestamp: int
+    signature: str
+
+    def signing_payload(self) -> bytes:
+        """Return the canonical byte layout covered by the signature."""
+        return _signing_payload(self.from_, self.to, self.amount, self.fee, self.timestamp)
+
+    def to_dict(self) -> dict:
+        """Return the wire representation sent to the DigiByte node."""
+        return {
+            "from": self.from_,
+            "to": self.to,
+            "amount": self.amount,
+            "fee": self.fee,
+            "timestamp": self.timestamp,
+            "signature": self.signature
+        }
+
+@dataclass
+class Token:
+    """An in-game token issued by a wallet."""
+    __slots__ = ("issuer", "token_name", "total_supply", "timestamp")
+    issuer: str
+    token_name: str
+    total_supply: int
+    timestamp: int
+
+    def to_dict(self) -> dict:
+        """Return the wire representation sent to the DigiByte node."""
+        return {
+            "issuer": self.issuer,
+            "token_name": self.token_name,
+            "total_supply": self.total_supply,
+            "timestamp": self.timestamp
+        }
+
+@dataclass
+class TokenTransfer:
+    """A transfer of an in-game token between addresses."""
+    __slots__ = ("token", "from_", "to", "amount", "timestamp")
+    token: Token
+    from_: str
+    to: str
+    amount: int
+    timestamp: int
+
+    def to_dict(self) -> dict:
+        """Return the wire representation sent to the DigiByte node."""
+        return {
+            "token": self.token.to_dict(),
+            "from": self.from_,
+            "to": self.to,
+            "amount": self.amount,
+            "timestamp": self.timestamp
+        }
+
+def _quantize_amount(value: float) -> float:
+    """Round an amount to 8 decimals (1 satoshi), so the signed `%.8f` text and the JSON number agree."""
+    if not math.isfinite(value):
+        raise ValueError(f"Amount must be a finite number, got {value!r}.")
+    return round(value, 8)
+
+def _signing_payload(sender: str, to_address: str, amount: float, fee: float, timestamp: int) -> bytes:
+    return f"{sender}|{to_address}|{amount:.8f}|{fee:.8f}|{timestamp}".encode()
+
+def _to_wire(obj):
+    """orjson `default` hook: serialize SDK records through their wire representation."""
+    if isinstance(obj, (Transaction, Token, TokenTransfer)):
+        return obj.to_dict()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+def _encode(obj) -> bytes:
+    """Serialize an SDK record (or plain JSON value) to JSON bytes."""
+    return _DUMPS(obj, default=_to_wire, option=orjson.OPT_PASSTHROUGH_DATACLASS)
+
+# ========================================================================
+# 🔹 Cryptography Helpers
+# ========================================================================
+# Module-level so they can be pickled into the signer process pool.
+
+_SECP256K1_ORDER = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
+_HARDENED = 0x80000000
+# BIP44 external chain for DigiByte (coin type 20): m/44'/20'/0'/0
+_DIGIBYTE_EXTERNAL_CHAIN = (44 | _HARDENED, 20 | _HARDENED, 0 | _HARDENED, 0)
+_P2PKH_VERSION = {"mainnet": 0x1E, "testnet": 0x7E}  # Base58 prefixes "D" and "t"
+_WIF_VERSIONS = {"mainnet": (0x80, 0x9E), "testnet": (0xFE, 0xEF)}  # Current and legacy DigiByte WIF prefixes
+_BASE58_ALPHABET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+# hashlib dispatches to OpenSSL (SHA-NI where available); OpenSSL 3 only ships ripemd160 with its legacy provider
+_HAS_RIPEMD160 = "ripemd160" in hashlib.algorithms_available
+
+# RIPEMD-160 message word order (_RMD_R*) and rotations (_RMD_S*) for the left and right lines
+_RMD_RL = (
+    0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 7, 4, 13, 1, 10, 6, 15, 3, 12, 0, 9, 5, 2, 14, 11, 8,
+    3, 10, 14, 4, 9, 15, 8, 1, 2, 7, 0, 6, 13, 11, 5, 12, 1, 9, 11, 10, 0, 8, 12, 4, 13, 3, 7, 15, 14, 5, 6, 2,
+    4, 0, 5, 9, 7, 12, 2, 10, 14, 1, 3, 8, 11, 6, 15, 13
+)
+_RMD_RR = (
+    5, 14, 7, 0, 9, 2, 11, 4, 13, 6, 15, 8, 1, 10, 3, 12, 6, 11, 3, 7, 0, 13, 5, 10, 14, 15, 8, 12, 4, 9, 1, 2,
+    15, 5, 1, 3, 7, 14, 6, 9, 11, 8, 12, 2, 10, 0, 4, 13, 8, 6, 4, 1, 3, 11, 15, 0, 5, 12, 2, 13, 9, 7, 10, 14,
+    12, 15, 10, 4, 1, 5, 8, 7, 6, 2, 13, 14, 0, 3, 9, 11
+)
+_RMD_SL = (
+    11, 14, 15, 12, 5, 8, 7, 9, 11, 13, 14, 15, 6, 7, 9, 8, 7, 6, 8, 13, 11, 9, 7, 15, 7, 12, 15, 9, 11, 7, 13, 12,
+    11, 13, 6, 7, 14, 9, 13, 15, 14, 8, 13, 6, 5, 12, 7, 5, 11, 12, 14, 15, 14, 15, 9, 8, 9, 14, 5, 6, 8, 6, 5, 12,
+    9, 15, 5, 11, 6, 8, 13, 12, 5, 12, 13, 14, 11, 8, 5, 6
+)
+_RMD_SR = (
+    8, 9, 9, 11, 13, 15, 15, 5, 7, 7, 8, 11, 14, 14, 12, 6, 9, 13, 15, 7, 12, 8, 9, 11, 7, 7, 12, 7, 6, 15, 13, 11,
+    9, 7, 15, 11, 8, 6, 6, 14, 12, 13, 5, 14, 13, 13, 7, 5, 15, 5, 8, 11, 14, 14, 6, 14, 6, 9, 12, 9, 12, 5, 15, 8,
+    8, 5, 12, 9, 12, 5, 14, 6, 8, 13, 6, 5, 15, 13, 11, 11
+)
+_RMD_KL = (0x00000000, 0x5A827999, 0x6ED9EBA1, 0x8F1BBCDC, 0xA953FD4E)
+_RMD_KR = (0x50A28BE6, 0x5C4DD124, 0x6D703EF3, 0x7A6D76E9, 0x00000000)
+
+def _rmd_f(round_index: int, x: int, y: int, z: int) -> int:
+    if round_index == 0:
+        return x ^ y ^ z
+    if round_index == 1:
+        return (x & y) | (~x & z)
+    if round_index == 2:
+        return (x | ~y) ^ z
+    if round_index == 3:
+        return (x & z) | (y & ~z)
+    return x ^ (y | ~z)
+
+def _rmd_rol(value: int, shift: int) -> int:
+    value &= 0xFFFFFFFF
+    return ((value << shift) | (value >> (32 - shift))) & 0xFFFFFFFF
+
+def _ripemd160_python(data: bytes) -> bytes:
+    """Pure-Python RIPEMD-160, for OpenSSL builds that do not expose it (only used on short public keys)."""
+    h0, h1, h2, h3, h4 = 0x67452301, 0xEFCDAB89, 0x98BADCFE, 0x10325476, 0xC3D2E1F0
+    message = data + b"\x80" + b"\x00" * ((55 - len(data)) % 64) + (8 * len(data)).to_bytes(8, "little")
+    for offset in range(0, len(message), 64):
+        words = [int.from_bytes(message[offset + i:offset + i + 4], "little") for i in range(0, 64, 4)]
+        al, bl, cl, dl, el = h0, h1, h2, h3, h4
+        ar, br, cr, dr, er = h0, h1, h2, h3, h4
+        for j in range(80):
+            round_index = j // 16
+            t = _rmd_rol(al + _rmd_f(round_index, bl, cl, dl) + words[_RMD_RL[j]] + _RMD_KL[round_index], _RMD_SL[j])
+            al, bl, cl, dl, el = el, (t + el) & 0xFFFFFFFF, bl, _rmd_rol(cl, 10), dl
+            t = _rmd_rol(ar + _rmd_f(4 - round_index, br, cr, dr) + words[_RMD_RR[j]] + _RMD_KR[round_index], _RMD_SR[j])
+            ar, br, cr, dr, er = er, (t + er) & 0xFFFFFFFF, br, _rmd_rol(cr, 10), dr
+        h0, h1, h2, h3, h4 = (
+            (h1 + cl + dr) & 0xFFFFFFFF, (h2 + dl + er) & 0xFFFFFFFF, (h3 + el + ar) & 0xFFFFFFFF,
+            (h4 + al + br) & 0xFFFFFFFF, (h0 + bl + cr) & 0xFFFFFFFF
+        )
+    return b"".join(h.to_bytes(4, "little") for h in (h0, h1, h2, h3, h4))
+
+def _hash160(data: bytes) -> bytes:
+    """RIPEMD160(SHA256(data)), via OpenSSL when it provides ripemd160."""
+    digest = hashlib.sha256(data).digest()
+    if _HAS_RIPEMD160:
+        return hashlib.new("ripemd160", digest).digest()
+    return _ripemd160_python(digest)
+
+def _sign_payloads(payloads: List[bytes], private_key: bytes) -> List[str]:
+    """ECDSA-sign the double SHA-256 of each payload with a secp256k1 key; returns DER signatures as hex."""
+    if coincurve is None:
+        return ["signed_with_private_key"] * len(payloads)  # Placeholder until coincurve is installed
+    sign = coincurve.PrivateKey(private_key).sign
+    sha256 = hashlib.sha256
+    return [sign(sha256(sha256(payload).digest()).digest(), hasher=None).hex() for payload in payloads]
+
+def _sign_payload(payload: bytes, private_key: bytes) -> str:
+    return _sign_payloads([payload], private_key)[0]
+
+def _base58check_encode(payload: bytes) -> str:
+    data = payload + hashlib.sha256(hashlib.sha256(payload).digest()).digest()[:4]
+    number = int.from_bytes(data, "big")
+    chars = []
+    while number:
+        number, remainder = divmod(number, 58)
+        chars.append(_BASE58_ALPHABET[remainder])
+    leading_zeros = len(data) - len(data.lstrip(b"\x00"))
+    return "1" * leading_zeros + "".join(reversed(chars))
+
+def _base58check_decode(text: str) -> bytes:
+    """Decode Base58Check text and verify its checksum; returns the payload without the checksum."""
+    number = 0
+    for char in text:
+        number = number * 58 + _BASE58_ALPHABET.index(char)
+    data = number.to_bytes((number.bit_length() + 7) // 8, "big")
+    data = b"\x00" * (len(text) - len(text.lstrip("1"))) + data
+    payload, checksum = data[:-4], data[-4:]
+    if len(data) < 5 or hashlib.sha256(hashlib.sha256(payload).digest()).digest()[:4] != checksum:
+        raise ValueError("Base58Check checksum mismatch")
+    return payload
+
+def _parse_private_key(private_key: str) -> Tuple[bytes, bool]:
+    """Parse a 64-character hex or WIF private key; returns (32-byte key, compressed public key flag)."""
+    try:
+        if len(private_key) == 64:
+            key, compressed = bytes.fromhex(private_key), True
+        else:
+            payload = _base58check_decode(private_key)
+            if payload[0] not in _WIF_VERSIONS[Config.NETWORK] or len(payload) not in (33, 34):
+                raise ValueError("not a WIF key for this network")
+            if len(payload) == 34 and payload[33] != 0x01:
+                raise ValueError("bad compression flag")
+            key, compressed = payload[1:33], len(payload) == 34
+    except ValueError as e:
+        raise ValueError(
+            f"Private key must be 32-byte hex or WIF-encoded for {Config.NETWORK} ({e})."
+        ) from None
+    if not 0 < int.from_bytes(key, "big") < _SECP256K1_ORDER:
+        raise ValueError("Private key is outside the secp256k1 key range.")
+    return key, compressed
+
+def _ckd_priv(parent_key: bytes, chain_code: bytes, index: int) -> Tuple[bytes, bytes]:
+    """BIP32 private child key derivation; returns (child_key, child_chain_code)."""
+    if index & _HARDENED:
+        data = b"\x00" + parent_key + index.to_bytes(4, "big")
+    else:
+        if coincurve is None:
+            raise RuntimeError("HD key derivation requires coincurve (pip install coincurve).")
+        data = coincurve.PublicKey.from_secret(parent_key).format(compressed=True) + index.to_bytes(4, "big")
+    digest = hmac.digest(chain_code, data, "sha512")
+    child_key = (int.from_bytes(digest[:32], "big") + int.from_bytes(parent_key, "big")) % _SECP256K1_ORDER
+    return child_key.to_bytes(32, "big"), digest[32:]
 
 # ========================================================================
 # 🔹 Wallet Module
 # ========================================================================
 class Wallet:
-    """Handles wallet creation, private key management, and address derivation."""
+    """Handles wallet creation, private key management, and address derivation.
+
+    `private_key` must be 32 bytes as 64 hex characters, or WIF-encoded for `Config.NETWORK`.
+    HD child keys follow BIP32/BIP44 (m/44'/20'/0'/0/index), using the wallet's private key as the seed.
+    """
     def __init__(self, private_key: Optional[str] = None):
+        # Per-wallet memo of (key, chain_code) for path prefixes, so sibling addresses share the parent derivation
+        self._derive_partial = functools.lru_cache(maxsize=None)(self._derive_path)
         try:
             if private_key:
                 self.private_key = private_key
-                self.address = self._generate_address_from_key(private_key)
+                self._private_key_bytes, self._compressed = _parse_private_key(private_key)
+                self.address = self._generate_address_from_key(self._private_key_bytes, self._compressed)
             else:
                 self.private_key, self.address = self._create_new_wallet()
-            logger.info(f"Wallet initialized. Address: {self.address}")
+            logger.info("Wallet initialized. Address: %s", self.address)
         except Exception as e:
             logger.exception("Error initializing wallet.")
             raise e
 
+    @property
+    def private_key_bytes(self) -> bytes:
+        """The raw 32-byte secp256k1 private key."""
+        return self._private_key_bytes
+
+    def derive_private_key(self, index: int) -> str:
+        """Derive the hex private key at m/44'/20'/0'/0/index."""
+        child_key, _ = self._derive_path(_DIGIBYTE_EXTERNAL_CHAIN + (index,))
+        return child_key.hex()
+
+    def derive_address(self, index: int) -> str:
+        """Derive the receiving address at m/44'/20'/0'/0/index."""
+        child_key, _ = self._derive_path(_DIGIBYTE_EXTERNAL_CHAIN + (index,))
+        return self._generate_address_from_key(child_key)
+
+    def _derive_path(self, path: Tuple[int, ...]) -> Tuple[bytes, bytes]:
+        """Return (key, chain_code) for `path`, reusing the memoized derivation of its parent prefix."""
+        if not path:
+            digest = hmac.digest(b"Bitcoin seed", self.private_key_bytes, "sha512")
+            return digest[:32], digest[32:]
+        parent_key, parent_chain_code = self._derive_partial(path[:-1])
+        return _ckd_priv(parent_key, parent_chain_code, path[-1])
+
     def _create_new_wallet(self):
-        """Generate a new secure wallet (Placeholder - Replace with real key generation)."""
-        private_key = "securely_generated_private_key"
-        address = "D8SampleAddress1234567890"
+        """Generate a new random hex private key and its P2PKH address."""
+        private_key = secrets.token_hex(32)
+        self._private_key_bytes, self._compressed = _parse_private_key(private_key)
+        address = self._generate_address_from_key(self._private_key_bytes)
         return private_key, address
 
-    def _generate_address_from_key(self, private_key: str) -> str:
-        """Derive the DigiByte address from a private key (Placeholder - Replace with actual cryptographic derivation)."""
-        return "D8DerivedAddressFromKey"
+    def _generate_address_from_key(self, private_key: bytes, compressed: bool = True) -> str:
+        """Derive the P2PKH address (Base58Check of RIPEMD160(SHA256(pubkey))) from a raw 32-byte private key."""
+        if coincurve is None:
+            raise RuntimeError("Wallet address derivation requires coincurve (pip install coincurve).")
+        public_key = coincurve.PublicKey.from_secret(private_key).format(compressed=compressed)
+        return _base58check_encode(bytes((_P2PKH_VERSION[Config.NETWORK],)) + _hash160(public_key))
+
+# ========================================================================
+# 🔹 Retry Module
+# ========================================================================
+class RetryManager:
+    """Retries transient network failures with exponential backoff, jitter, and an overall deadline.
+
+    A Retry-After or X-RateLimit-Reset sent with the failure sets a lower bound on the next delay.
+    """
+
+    @staticmethod
+    def is_retryable(error: Exception) -> bool:
+        """Connection errors, timeouts, 429 and 5xx responses are retried; everything else (e.g. 4xx) is not."""
+        if isinstance(error, HttpStatusError):
+            return error.status >= 500 or error.status == 429
+        if httpx is not None and isinstance(error, httpx.TransportError):
+            return True
+        return isinstance(error, (aiohttp.ClientConnectionError, asyncio.TimeoutError))
+
+    async def run(self, operation: Callable[..., Awaitable[Any]], *args, description: str = "Request") -> Any:
+        """Await `operation(*args)`, retrying retryable failures. Re-raises the last error once attempts or time run out."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + Config.RETRY_DEADLINE
+        attempts = Config.RETRY_ATTEMPTS
+        for attempt in range(attempts):
+            try:
+                return await operation(*args)
+            except Exception as e:
+                if not self.is_retryable(e):
+                    raise
+                logger.warning("%s attempt %d failed: %s", description, attempt + 1, e)
+                if attempt + 1 == attempts:
+                    raise
+                delay = min(Config.RETRY_MAX_DELAY, Config.RETRY_BASE_DELAY * 2 ** attempt)
+                delay += random.uniform(0, Config.RETRY_JITTER)
+                if isinstance(e, HttpStatusError) and e.retry_after is not None:
+                    delay = max(delay, e.retry_after)  # Never retry sooner than the node asked
+                if loop.time() + delay >= deadline:
+                    logger.warning("%s retry deadline of %ss exceeded.", description, Config.RETRY_DEADLINE)
+                    raise
+            await asyncio.sleep(delay)
+
+# ========================================================================
+# 🔹 HTTP Transport Module
+# ========================================================================
+class HttpStatusError(Exception):
+    """An HTTP error response from the DigiByte node, whichever HTTP backend is in use."""
+    def __init__(self, status: int, url: str, reason: str = "", retry_after: Optional[float] = None):
+        super().__init__(f"HTTP {status} {reason} from {url}" if reason else f"HTTP {status} from {url}")
+        self.status = status
+        self.url = url
+        self.retry_after = retry_after  # Seconds the node asked us to wait (Retry-After / X-RateLimit-Reset)
+
+def _retry_after_seconds(headers) -> Optional[float]:
+    """Seconds until the node accepts requests again, from Retry-After or X-RateLimit-Reset; None if not given.
+
+    The result is capped at Config.RATE_LIMIT_MAX_WAIT so a bogus header cannot stall the SDK.
+    """
+    delay = None
+    retry_after = headers.get("Retry-After")
+    if retry_after is not None:
+        if retry_after.isdigit():
+            delay = float(retry_after)
+        else:
+            try:
+                delay = email.utils.parsedate_to_datetime(retry_after).timestamp() - time.time()
+            except (TypeError, ValueError, OverflowError):
+                pass
+    reset = headers.get("X-RateLimit-Reset")
+    if delay is None and reset is not None:
+        try:
+            reset_value = float(reset)
+        except ValueError:
+            return None
+        if not math.isfinite(reset_value):
+            return None
+        # Nodes send either seconds until the window resets or the reset time as a Unix timestamp
+        delay = reset_value - time.time() if reset_value > 1e9 else reset_value
+    if delay is None:
+        return None
+    return min(max(0.0, delay), Config.RATE_LIMIT_MAX_WAIT)
+
+class HttpClient:
+    """The SDK's single long-lived HTTP client: a pooled aiohttp session, or httpx over HTTP/2 when Config.USE_HTTP2 is set."""
+    def __init__(self):
+        self.session: Optional[aiohttp.ClientSession] = None
+        self._client = None  # httpx.AsyncClient when running over HTTP/2
+        self.rate_limit_remaining: Optional[int] = None  # X-RateLimit-Remaining from the latest response, if sent
+        self.rate_limit_resume_at: Optional[float] = None  # Loop time before which the node asked for no requests
+
+    @property
+    def closed(self) -> bool:
+        return self.session is None and self._client is None
+
+    @property
+    def supports_websocket(self) -> bool:
+        return self.session is not None
+
+    async def open(self):
+        """Create the underlying client (no-op if already open)."""
+        if not self.closed:
+            return
+        if Config.USE_HTTP2:
+            try:
+                if httpx is None:
+                    raise ImportError("httpx is not installed")
+                self._client = httpx.AsyncClient(
+                    http2=True,
+                    limits=httpx.Limits(
+                        max_connections=Config.CONNECTION_LIMIT,
+                        max_keepalive_connections=Config.CONNECTION_LIMIT_PER_HOST,
+                        keepalive_expiry=Config.KEEPALIVE_TIMEOUT
+                    ),
+                    timeout=Config.HTTP_TIMEOUT
+                )
+                logger.info("HTTP/2 client opened.")
+                return
+            except ImportError as e:
+                logger.warning("HTTP/2 unavailable (%s); falling back to aiohttp.", e)
+        self.session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=Config.CONNECTION_LIMIT,
+                limit_per_host=Config.CONNECTION_LIMIT_PER_HOST,
+                keepalive_timeout=Config.KEEPALIVE_TIMEOUT,
+                ttl_dns_cache=Config.DNS_CACHE_TTL
+            ),
+            timeout=aiohttp.ClientTimeout(total=Config.HTTP_TIMEOUT)
+        )
+        logger.info("HTTP session opened.")
+
+    async def close(self):
+        """Close the underlying client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+        logger.info("HTTP session closed.")
+
+    async def discard(self):
+        """Close a client opened on another event loop as far as possible, then forget it."""
+        try:
+            await self.close()
+        except Exception as e:
+            logger.debug("Could not cleanly close a stale HTTP client: %s", e)
+        self.session = None
+        self._client = None
+
+    async def post(self, url: str, data: bytes, headers: dict) -> bytes:
+        """POST `data` and return the response body, raising on HTTP error statuses."""
+        if self._client is not None:
+            response = await self._client.post(url, content=data, headers=headers)
+            retry_after = self._track_rate_limit(response.headers, response.status_code)
+            if response.status_code >= 400:
+                raise HttpStatusError(response.status_code, url, response.reason_phrase, retry_after)
+            return response.content
+        async with self.session.post(url, data=data, headers=headers) as response:
+            retry_after = self._track_rate_limit(response.headers, response.status)
+            if response.status >= 400:
+                raise HttpStatusError(response.status, url, response.reason or "", retry_after)
+            return await response.read()
+
+    async def get(self, url: str, params: dict, timeout: float) -> bytes:
+        """GET with a per-request total timeout and return the response body, raising on HTTP error statuses."""
+        if self._client is not None:
+            response = await self._client.get(url, params=params, timeout=timeout)
+            if response.status_code >= 400:
+                raise HttpStatusError(response.status_code, url, response.reason_phrase)
+            return response.content
+        async with self.session.get(url, params=params, timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+            if response.status >= 400:
+                raise HttpStatusError(response.status, url, response.reason or "")
+            return await response.read()
+
+    @contextlib.asynccontextmanager
+    async def ws_connect(self, url: str, params: dict, heartbeat: float):
+        """Open a WebSocket on the aiohttp session; a rejected handshake raises HttpStatusError."""
+        try:
+            ws = await self.session.ws_connect(url, params=params, heartbeat=heartbeat)
+        except aiohttp.WSServerHandshakeError as e:
+            raise HttpStatusError(e.status, url, e.message) from e
+        try:
+            yield ws
+        finally:
+            await ws.close()
+
+    def _track_rate_limit(self, headers, status: int) -> Optional[float]:
+        """Record the node's rate-limit state from a response; returns its requested back-off in seconds, if any."""
+        remaining = headers.get("X-RateLimit-Remaining")
+        self.rate_limit_remaining = int(remaining) if remaining is not None and remaining.isdigit() else None
+        if status not in (429, 503) and self.rate_limit_remaining != 0:
+            return None
+        retry_after = _retry_after_seconds(headers)
+        if retry_after is not None:
+            resume_at = asyncio.get_running_loop().time() + retry_after
+            if self.rate_limit_resume_at is None or resume_at > self.rate_limit_resume_at:
+                self.rate_limit_resume_at = resume_at
+        return retry_after
 
 # ========================================================================
 # 🔹 Transaction Module
 # ========================================================================
 class TransactionManager:
     """Handles creation, signing, and broadcasting of DigiByte transactions."""
-    def __init__(self, wallet: Wallet):
+    def __init__(self, wallet: Wallet, http: Optional[HttpClient] = None):
         self.wallet = wallet
+        self.http = http
+        self.retry = RetryManager()
+        self._broadcast_url = f"{Config.DIGIBYTE_API_URL}/broadcast"
+        self._post_headers = {"Content-Type": "application/json"}
+        self._signer_pool: Optional[concurrent.futures.ProcessPoolExecutor] = None
 
-    def create_transaction(self, to_address: str, amount: float, fee: float = 0.001) -> dict:
-        """Create a transaction."""
+    def create_transaction(self, to_address: str, amount: float, fee: float = 0.001) -> Transaction:
+        """Create an unsigned transaction."""
         try:
-            transaction = {
-                "from": self.wallet.address,
+            transaction = Transaction(
+                self.wallet.address, to_address, _quantize_amount(amount), _quantize_amount(fee), _now_s(), ""
+            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Transaction created: %s", transaction)
+            return transaction
+        except Exception as e:
+            logger.exception("Failed to create transaction.")
+            raise
+
+    def build_signed_payment(self, to_address: str, amount: float, fee: float = 0.001) -> bytes:
+        """Create, sign, and encode a payment in one pass, returning the JSON broadcast body.
+
+        Equivalent to encoding sign_transaction(create_transaction(...)) without building the intermediate record.
+        """
+        try:
+            sender = self.wallet.address
+            amount = _quantize_amount(amount)
+            fee = _quantize_amount(fee)
+            timestamp = _now_s()
+            payload = _signing_payload(sender, to_address, amount, fee, timestamp)
+            signature = _sign_payload(payload, self.wallet.private_key_bytes)
+            return _DUMPS({
+                "from": sender,
                 "to": to_address,
                 "amount": amount,
                 "fee": fee,
-                "timestamp": int(time.time())
-            }
-            logger.debug(f"Transaction created: {transaction}")
-            return transaction
+                "timestamp": timestamp,
+                "signature": signature
+            })
         except Exception as e:
-            logger.exception("Failed to create transaction.")
+            logger.exception("Failed to build signed payment.")
             raise
 
-    def sign_transaction(self, transaction: dict) -> dict:
-        """Sign a transaction (Placeholder - Replace with actual cryptographic signing)."""
+    def encode_transaction(self, signed_transaction: Transaction) -> bytes:
+        """Serialize a signed transaction to its JSON broadcast body."""
+        return _encode(signed_transaction)
+
+    def sign_transaction(self, transaction: Transaction) -> Transaction:
+        """Sign a transaction in place on the calling thread."""
         try:
-            transaction["signature"] = "signed_with_private_key"
+            transaction.signature = _sign_payload(transaction.signing_payload(), self.wallet.private_key_bytes)
             logger.debug("Transaction signed successfully.")
             return transaction
         except Exception as e:
             logger.exception("Transaction signing failed.")
             raise
 
-    async def broadcast_transaction(self, signed_transaction: dict) -> dict:
+    async def sign_transaction_async(self, transaction: Transaction) -> Transaction:
+        """Sign a transaction in place in the signer process pool, keeping the event loop free."""
+        await self.sign_transactions_async([transaction])
+        return transaction
+
+    async def sign_transactions_async(self, transactions: List[Transaction]) -> List[Transaction]:
+        """Sign a batch of transactions in place, one process-pool hop per chunk of the batch."""
+        try:
+            loop = asyncio.get_running_loop()
+            pool = self._get_signer_pool()
+            private_key = self.wallet.private_key_bytes
+            workers = Config.SIGNER_PROCESSES or os.cpu_count() or 1
+            chunk_size = max(Config.SIGN_OFFLOAD_THRESHOLD, math.ceil(len(transactions) / workers))
+            chunks = [transactions[i:i + chunk_size] for i in range(0, len(transactions), chunk_size)]
+            signatures = await asyncio.gather(*(
+                loop.run_in_executor(pool, _sign_payloads, [tx.signing_payload() for tx in chunk], private_key)
+                for chunk in chunks
+            ))
+            for chunk, chunk_signatures in zip(chunks, signatures):
+                for transaction, signature in zip(chunk, chunk_signatures):
+                    transaction.signature = signature
+            logger.debug("Signed %d transactions.", len(transactions))
+            return transactions
+        except Exception as e:
+            logger.exception("Batch transaction signing failed.")
+            raise
+
+    def _get_signer_pool(self) -> concurrent.futures.ProcessPoolExecutor:
+        if self._signer_pool is None:
+            self._signer_pool = concurrent.futures.ProcessPoolExecutor(max_workers=Config.SIGNER_PROCESSES)
+        return self._signer_pool
+
+    def close(self):
+        """Shut down the signer process pool, if one was started."""
+        if self._signer_pool is not None:
+            self._signer_pool.shutdown(wait=False)
+            self._signer_pool = None
+
+    async def broadcast_transaction(self, signed_transaction: Transaction) -> dict:
         """Broadcast a transaction to the DigiByte network with retry logic."""
-        for attempt in range(Config.RETRY_ATTEMPTS):
-            try:
-                async with aiohttp.ClientSession() as session:
-                    async with session.post(
-                        f"{Config.DIGIBYTE_API_URL}/broadcast",
-                        json=signed_transaction,
-                        timeout=10
-                    ) as response:
-                        response.raise_for_status()
-                        data = await response.json()
-                        logger.info("Transaction broadcast successfully.")
-                        return data
-            except Exception as e:
-                logger.warning(f"Broadcast attempt {attempt+1} failed: {e}")
-                await asyncio.sleep(Config.RETRY_DELAY)
-        logger.error("All transaction broadcast attempts failed.")
-        raise Exception("Transaction broadcast failed.")
+        return await self.broadcast_payload(self.encode_transaction(signed_transaction))
+
+    async def broadcast_payload(self, body: bytes) -> dict:
+        """Broadcast an already-encoded signed transaction body with retry logic."""
+        if self.http is None or self.http.closed:
+            raise RuntimeError("No HTTP session available. Call DigiplayGamingSDK.connect() first.")
+        try:
+            return await self.retry.run(self._post_broadcast, body, description="Broadcast")
+        except Exception as e:
+            if not self.retry.is_retryable(e):
+                raise
+            logger.error("All transaction broadcast attempts failed.")
+            raise Exception("Transaction broadcast failed.") from e
+
+    async def _post_broadcast(self, body: bytes) -> dict:
+        """Perform a single broadcast request."""
+        data = _LOADS(await self.http.post(self._broadcast_url, body, self._post_headers))
+        logger.info("Transaction broadcast successfully.")
+        return data
 
 # ========================================================================
 # 🔹 Tokenization Module
@@ -126,32 +717,21 @@ class TokenManager:
     def __init__(self, wallet: Wallet):
         self.wallet = wallet
 
-    def create_token(self, token_name: str, total_supply: int) -> dict:
+    def create_token(self, token_name: str, total_supply: int) -> Token:
         """Issue a new token."""
         try:
-            token_data = {
-                "issuer": self.wallet.address,
-                "token_name": token_name,
-                "total_supply": total_supply,
-                "timestamp": int(time.time())
-            }
-            logger.debug(f"Token created: {token_data}")
+            token_data = Token(self.wallet.address, token_name, total_supply, _now_s())
+            logger.debug("Token created: %s", token_data)
             return token_data
         except Exception as e:
             logger.exception("Token creation failed.")
             raise
 
-    def transfer_token(self, token: dict, to_address: str, amount: int) -> dict:
+    def transfer_token(self, token: Token, to_address: str, amount: int) -> TokenTransfer:
         """Transfer a token."""
         try:
-            transfer_data = {
-                "token": token,
-                "from": self.wallet.address,
-                "to": to_address,
-                "amount": amount,
-                "timestamp": int(time.time())
-            }
-            logger.debug(f"Token transfer initiated: {transfer_data}")
+            transfer_data = TokenTransfer(token, self.wallet.address, to_address, amount, _now_s())
+            logger.debug("Token transfer initiated: %s", transfer_data)
             return transfer_data
         except Exception as e:
             logger.exception("Token transfer failed.")
@@ -161,53 +741,408 @@ class TokenManager:
 # 🔹 Blockchain Event Listener Module
 # ========================================================================
 class BlockchainEventListener:
-    """Listens for blockchain events."""
-    def __init__(self, callback: Callable[[dict], None]):
+    """Listens for blockchain events pushed over a WebSocket, falling back to long-polling.
+
+    `callback` may be a coroutine function, in which case each batch of events is awaited
+    concurrently on the event loop. Plain functions are run in the default thread pool so a
+    slow callback never blocks the loop; they must not touch loop-bound objects directly.
+    """
+    def __init__(self, callback: Callable[[dict], Any], http: Optional[HttpClient] = None):
         self.callback = callback
+        self.http = http
+        if asyncio.iscoroutinefunction(callback):
+            self._dispatch_batch = self._dispatch_async
+        else:
+            self._dispatch_batch = self._dispatch_in_executor
         self.running = False
+        self.last_seen_cursor: Optional[str] = None
+        self._events_url = f"{Config.DIGIBYTE_API_URL}/events"
+        self._websocket_supported = True
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stopped: Optional[asyncio.Event] = None
+        self._ws: Optional[aiohttp.ClientWebSocketResponse] = None
 
     async def start_listening(self):
-        """Start polling for blockchain events."""
+        """Subscribe to blockchain events, re-subscribing from the last seen cursor if the stream drops."""
+        if self.http is None or self.http.closed:
+            raise RuntimeError("No HTTP session available. Call DigiplayGamingSDK.connect() first.")
         self.running = True
+        self._loop = asyncio.get_running_loop()
+        self._stopped = asyncio.Event()
         logger.info("Blockchain event listener started.")
         while self.running:
+            stream = self._stream_blockchain_events()
+            dispatch = self._dispatch_batch
+            advance_cursor = self._advance_cursor
             try:
-                events = await self._get_blockchain_events()
-                for event in events:
-                    self.callback(event)
+                async for events in stream:
+                    # The cursor only moves past a batch once its callbacks have run, so a dropped
+                    # subscription re-delivers it from the last fully dispatched event
+                    await dispatch(events)
+                    advance_cursor(events)
+                    if not self.running:
+                        break
             except Exception as e:
                 logger.exception("Error in event listener loop.")
-            await asyncio.sleep(Config.EVENT_POLL_INTERVAL)
+            finally:
+                await stream.aclose()
+            if self.running:
+                await self._unless_stopped(asyncio.sleep(Config.EVENT_RECONNECT_DELAY))
+
+    async def _dispatch_async(self, events: List[dict]):
+        results = await asyncio.gather(*(self.callback(event) for event in events), return_exceptions=True)
+        for event, result in zip(events, results):
+            if isinstance(result, Exception):
+                logger.error("Event callback failed for %s.", event, exc_info=result)
+
+    async def _dispatch_in_executor(self, events: List[dict]):
+        await asyncio.get_running_loop().run_in_executor(None, self._run_callbacks, events)
+
+    def _run_callbacks(self, events: List[dict]):
+        callback = self.callback
+        for event in events:
+            try:
+                callback(event)
+            except Exception:
+                logger.exception("Event callback failed for %s.", event)
 
     def stop_listening(self):
-        """Stop the event listener."""
+        """Stop the event listener, interrupting any open subscription. Safe to call from callback threads."""
         self.running = False
+        if self._loop is not None and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._signal_stop)
         logger.info("Blockchain event listener stopped.")
 
+    def _signal_stop(self):
+        self._stopped.set()
+        if self._ws is not None and not self._ws.closed:
+            asyncio.ensure_future(self._ws.close())
+
+    async def _unless_stopped(self, awaitable: Awaitable[Any]) -> Any:
+        """Await `awaitable`, abandoning it as soon as stop_listening() is called (returns None in that case)."""
+        task = asyncio.ensure_future(awaitable)
+        stopped = asyncio.ensure_future(self._stopped.wait())
+        try:
+            await asyncio.wait((task, stopped), return_when=asyncio.FIRST_COMPLETED)
+        except asyncio.CancelledError:
+            task.cancel()
+            raise
+        finally:
+            stopped.cancel()
+        if task.done():
+            return task.result()
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        return None
+
+    async def _stream_blockchain_events(self) -> AsyncIterator[List[dict]]:
+        """Yield batches of events as the node pushes them, resuming after `last_seen_cursor`."""
+        if self._websocket_supported and self.http.supports_websocket:
+            try:
+                async with self.http.ws_connect(
+                    self._events_url,
+                    self._cursor_params(),
+                    Config.EVENT_WAIT_TIMEOUT
+                ) as ws:
+                    # stop_listening() closes the socket, which ends the `async for` below
+                    self._ws = ws
+                    if self._stopped.is_set():
+                        return
+                    logger.info("Subscribed to blockchain events via WebSocket.")
+                    error_type = aiohttp.WSMsgType.ERROR
+                    try:
+                        async for msg in ws:
+                            if msg.type == error_type:
+                                raise ws.exception()
+                            payload = msg.json(loads=_LOADS)
+                            events = payload if isinstance(payload, list) else [payload]
+                            yield events
+                    finally:
+                        self._ws = None
+                return
+            except HttpStatusError as e:
+                logger.info("WebSocket events unavailable (%s); falling back to long-polling.", e.status)
+                self._websocket_supported = False
+        get_events = self._get_blockchain_events
+        unless_stopped = self._unless_stopped
+        while self.running:
+            events = await unless_stopped(get_events())
+            if events:
+                yield events
+
     async def _get_blockchain_events(self) -> list:
-        """Fetch blockchain events (Placeholder - Replace with real API integration)."""
-        return []
+        """Long-poll the node for events after `last_seen_cursor`; returns when events arrive or the wait expires."""
+        params = self._cursor_params()
+        params["wait"] = Config.EVENT_WAIT_TIMEOUT
+        body = await self.http.get(self._events_url, params, Config.EVENT_WAIT_TIMEOUT + Config.HTTP_TIMEOUT)
+        return _LOADS(body)
+
+    def _cursor_params(self) -> dict:
+        return {} if self.last_seen_cursor is None else {"since": self.last_seen_cursor}
+
+    def _advance_cursor(self, events: List[dict]):
+        cursor = events[-1].get("cursor") if events else None
+        if cursor is not None:
+            self.last_seen_cursor = str(cursor)
 
 # ========================================================================
 # 🔹 Digiplay Gaming SDK Main Interface
 # ========================================================================
 class DigiplayGamingSDK:
-    """Main interface for the Digiplay Gaming SDK."""
+    """Main interface for the Digiplay Gaming SDK.
+
+    Use `async with DigiplayGamingSDK() as sdk:` (or connect()/close()) to keep one pooled connection open.
+    Payment calls made without it open a connection for the duration of the call and close it afterwards.
+    """
     def __init__(self, wallet_private_key: Optional[str] = None):
         self.wallet = Wallet(wallet_private_key)
-        self.tx_manager = TransactionManager(self.wallet)
+        self._http = HttpClient()
+        self.tx_manager = TransactionManager(self.wallet, self._http)
         self.token_manager = TokenManager(self.wallet)
         self.event_listener: Optional[BlockchainEventListener] = None
+        self._listener_task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None  # Loop the queue, workers and session belong to
+        self._keep_open = False  # Set by connect(); otherwise calls close the connection they opened
+        self._auto_connect_calls = 0
+        self._tx_queue: Optional[asyncio.Queue] = None
+        self._broadcast_workers: List[asyncio.Task] = []
+        self._broadcast_slots: Optional[asyncio.Condition] = None
+        self._broadcast_limit = Config.BROADCAST_CONCURRENCY
+        self._broadcasts_in_flight = 0
+        logger.debug("Hashing backend: %s (ripemd160 available: %s)", ssl.OPENSSL_VERSION, _HAS_RIPEMD160)
         logger.info("Digiplay Gaming SDK initialized.")
 
+    async def __aenter__(self) -> "DigiplayGamingSDK":
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def connect(self):
+        """Open the shared HTTP client and start the broadcast workers on the running loop (no-op if already open).
+
+        A connection left on another event loop (e.g. by an earlier asyncio.run) is discarded and rebuilt.
+        """
+        await self._open()
+        self._keep_open = True
+
+    async def _open(self):
+        loop = asyncio.get_running_loop()
+        if self._is_connected_on(loop):
+            return
+        if self._loop is not None:
+            await self._discard_connection()
+        self._loop = loop
+        self._keep_open = False
+        self._auto_connect_calls = 0
+        await self._http.open()
+        self._tx_queue = asyncio.Queue(maxsize=Config.TX_QUEUE_SIZE)
+        self._broadcast_slots = asyncio.Condition()
+        self._broadcast_limit = Config.BROADCAST_CONCURRENCY
+        self._broadcast_workers = [
+            asyncio.create_task(self._broadcast_worker()) for _ in range(Config.BROADCAST_CONCURRENCY)
+        ]
+
+    async def close(self):
+        """Stop the event listener, finish queued broadcasts, and release the signer pool and HTTP session."""
+        if self._loop is not None and not self._is_connected_on(asyncio.get_running_loop()):
+            await self._discard_connection()
+            self.tx_manager.close()
+            return
+        await self.stop_event_listener()
+        if self._tx_queue is not None:
+            await self._tx_queue.join()
+            for worker in self._broadcast_workers:
+                worker.cancel()
+            await asyncio.gather(*self._broadcast_workers, return_exceptions=True)
+            self._broadcast_workers = []
+            self._tx_queue = None
+        self.tx_manager.close()
+        if not self._http.closed:
+            await self._http.close()
+        self._loop = None
+        self._keep_open = False
+
+    @contextlib.asynccontextmanager
+    async def _connection(self):
+        """Run a call on the open connection; without connect() or `async with`, open one just for the call."""
+        if self._keep_open and self._is_connected_on(asyncio.get_running_loop()):
+            yield
+            return
+        await self._open()
+        self._auto_connect_calls += 1
+        try:
+            yield
+        finally:
+            self._auto_connect_calls -= 1
+            if not self._auto_connect_calls and not self._keep_open:
+                await self.close()
+
+    def _is_connected_on(self, loop: asyncio.AbstractEventLoop) -> bool:
+        """True if the queue, a live broadcast worker and the HTTP client are all bound to `loop`."""
+        return (
+            self._loop is loop and not self._http.closed
+            and any(not worker.done() for worker in self._broadcast_workers)
+        )
+
+    async def _discard_connection(self):
+        """Drop a connection whose loop has gone away or whose workers died; queued broadcasts are abandoned."""
+        logger.warning("Discarding a stale SDK connection (event loop changed or broadcast workers stopped).")
+        old_loop = self._loop
+        if old_loop is not None and not old_loop.is_closed():
+            for worker in self._broadcast_workers:
+                old_loop.call_soon_threadsafe(worker.cancel)
+        if self.event_listener is not None:
+            self.event_listener.stop_listening()
+        self._listener_task = None
+        self._broadcast_workers = []
+        self._tx_queue = None
+        self._broadcasts_in_flight = 0
+        self._loop = None
+        await self._http.discard()
+
     async def send_payment(self, to_address: str, amount: float) -> dict:
-        """Create, sign, and broadcast a payment transaction."""
-        tx = self.tx_manager.create_transaction(to_address, amount)
-        signed_tx = self.tx_manager.sign_transaction(tx)
-        return await self.tx_manager.broadcast_transaction(signed_tx)
+        """Create and sign a payment transaction, then wait for a broadcast worker to send it."""
+        async with self._connection():
+            tx = self.tx_manager.create_transaction(to_address, amount)
+            signed_tx = self.tx_manager.sign_transaction(tx)
+            return await (await self._enqueue(self.tx_manager.encode_transaction(signed_tx)))
+
+    async def send_payment_fast(self, to_address: str, amount: float, fee: float = 0.001) -> dict:
+        """Like send_payment, but creates, signs, and encodes the transaction in a single fused pass."""
+        async with self._connection():
+            return await (await self._enqueue(self.tx_manager.build_signed_payment(to_address, amount, fee)))
+
+    async def send_payments(self, payments: List[Tuple[str, float]]) -> List[Union[dict, BaseException]]:
+        """Create, sign, and broadcast many (to_address, amount) payments concurrently.
+
+        Returns one result per payment, in order; a failed broadcast is returned as its exception instead of raised.
+        """
+        async with self._connection():
+            tx_manager = self.tx_manager
+            txs = [tx_manager.create_transaction(to_address, amount) for to_address, amount in payments]
+            if len(txs) > Config.SIGN_OFFLOAD_THRESHOLD:
+                signed_txs = await tx_manager.sign_transactions_async(txs)
+            else:
+                signed_txs = [tx_manager.sign_transaction(tx) for tx in txs]
+            encode = tx_manager.encode_transaction
+            futures = [await self._enqueue(encode(signed_tx)) for signed_tx in signed_txs]
+            return await asyncio.gather(*futures, return_exceptions=True)
+
+    async def _enqueue(self, body: bytes) -> "asyncio.Future[dict]":
+        """Queue an encoded signed transaction for broadcast, waiting for room if the queue is full."""
+        future = asyncio.get_running_loop().create_future()
+        await self._tx_queue.put((body, future))
+        return future
+
+    async def _broadcast_worker(self):
+        """Broadcast queued transactions until cancelled, resolving each submitter's future."""
+        # Bound once: these run for every queued transaction
+        queue = self._tx_queue
+        acquire_slot = self._acquire_broadcast_slot
+        release_slot = self._release_broadcast_slot
+        broadcast = self.tx_manager.broadcast_payload
+        while True:
+            body, future = await queue.get()
+            try:
+                await acquire_slot()
+                try:
+                    result = await broadcast(body)
+                finally:
+                    await release_slot()
+                if not future.done():
+                    future.set_result(result)
+            except asyncio.CancelledError:
+                future.cancel()
+                raise
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+            finally:
+                queue.task_done()
+
+    async def _acquire_broadcast_slot(self):
+        """Wait out any back-off the node requested, then take one of the in-flight broadcast slots."""
+        loop = asyncio.get_running_loop()
+        while True:
+            resume_at = self._http.rate_limit_resume_at
+            if resume_at is None or resume_at <= loop.time():
+                break
+            await asyncio.sleep(resume_at - loop.time())
+        async with self._broadcast_slots:
+            await self._broadcast_slots.wait_for(lambda: self._broadcasts_in_flight < self._broadcast_limit)
+            self._broadcasts_in_flight += 1
+
+    async def _release_broadcast_slot(self):
+        """Free a slot and resize the in-flight limit to the node's remaining rate-limit budget."""
+        async with self._broadcast_slots:
+            self._broadcasts_in_flight -= 1
+            remaining = self._http.rate_limit_remaining
+            if remaining is None:
+                self._broadcast_limit = Config.BROADCAST_CONCURRENCY
+            else:
+                self._broadcast_limit = max(1, min(Config.BROADCAST_CONCURRENCY, remaining))
+            self._broadcast_slots.notify_all()
+
+    async def start_event_listener(self, callback: Callable[[dict], Any]) -> BlockchainEventListener:
+        """Start streaming blockchain events to `callback` in the background."""
+        await self.connect()
+        await self.stop_event_listener()
+        self.event_listener = BlockchainEventListener(callback, self._http)
+        self._listener_task = asyncio.create_task(self.event_listener.start_listening())
+        return self.event_listener
+
+    async def stop_event_listener(self):
+        """Stop the background event listener, if one is running."""
+        if self._listener_task is None:
+            return
+        self.event_listener.stop_listening()
+        try:
+            await asyncio.wait_for(self._listener_task, Config.HTTP_TIMEOUT)
+        except asyncio.TimeoutError:
+            logger.warning("Event listener did not stop within %ss; cancelled it.", Config.HTTP_TIMEOUT)
+        except Exception:
+            logger.exception("Event listener exited with an error.")
+        self._listener_task = None
+
+# ========================================================================
+# 🔹 Event Loop Acceleration
+# ========================================================================
+def install_fast_event_loop() -> bool:
+    """Use a faster asyncio event loop if one is installed. Call before asyncio.run().
+
+    With Config.USE_RLOOP on Linux, rloop is preferred for plain-HTTP nodes; otherwise uvloop is used.
+    Returns True if a faster loop was installed, False if the default asyncio loop is kept.
+    """
+    if Config.USE_RLOOP and sys.platform == "linux":
+        if Config.DIGIBYTE_API_URL.startswith("https://"):
+            logger.warning("rloop does not support TLS; ignoring USE_RLOOP for %s.", Config.DIGIBYTE_API_URL)
+        else:
+            try:
+                import rloop
+            except ImportError:
+                logger.warning("rloop not installed; trying uvloop instead.")
+            else:
+                asyncio.set_event_loop_policy(rloop.EventLoopPolicy())
+                logger.info("Using rloop event loop.")
+                return True
+    try:
+        import uvloop
+    except ImportError:
+        logger.info("uvloop not installed; using the default asyncio event loop.")
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    logger.info("Using uvloop event loop.")
+    return True
 
 # ========================================================================
 # 🔹 Example Usage
 # ========================================================================
+async def _demo():
+    async with DigiplayGamingSDK() as sdk:
+        await sdk.send_payment("D8RecipientAddress0987654321", 0.1)
+
 if __name__ == "__main__":
-    asyncio.run(DigiplayGamingSDK().send_payment("D8RecipientAddress0987654321", 0.1))
+    install_fast_event_loop()
+    asyncio.run(_demo())
@@ -0,0 +1,493 @@
+"""Regression tests for the Digiplay Gaming SDK's key derivation, addresses, transaction encoding, and networking."""
+import asyncio
+import hmac
+import threading
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+import digiplay_gaming_sdk as sdk
+
+requires_coincurve = pytest.mark.skipif(sdk.coincurve is None, reason="coincurve is not installed")
+
+# ========================================================================
+# 🔹 HD Key Derivation (BIP32)
+# ========================================================================
+# BIP32 test vector 1: seed 000102030405060708090a0b0c0d0e0f, path m/0'/1/2'/2/1000000000
+BIP32_VECTOR_1_SEED = bytes.fromhex("000102030405060708090a0b0c0d0e0f")
+BIP32_VECTOR_1 = [
+    (0 | sdk._HARDENED, "edb2e14f9ee77d26dd93b4ecede8d16ed408ce149b6cd80b0715a2d911a0afea"),
+    (1, "3c6cb8d0f6a264c91ea8b5030fadaa8e538b020f0a387421a12de9319dc93368"),
+    (2 | sdk._HARDENED, "cbce0d719ecf7431d88e6a89fa1483e02e35092af60c042b1df2ff59fa424dca"),
+    (2, "0f479245fb19a38a1954c5c7c0ebab2f9bdfd96a17563ef28a6a4b1a2a764ef4"),
+    (1000000000, "471b76e389e528d6de6d816857e012c5455051cad6660850e58372a6c3e6e7c8"),
+]
+
+
+@requires_coincurve
+def test_bip32_vector_1():
+    digest = hmac.digest(b"Bitcoin seed", BIP32_VECTOR_1_SEED, "sha512")
+    key, chain_code = digest[:32], digest[32:]
+    assert key.hex() == "e8f32e723decf4051aefac8e2c93c9c5b214313817cdb01a1494b917c8436b35"
+    for index, expected_key in BIP32_VECTOR_1:
+        key, chain_code = sdk._ckd_priv(key, chain_code, index)
+        assert key.hex() == expected_key
+
+
+@requires_coincurve
+def test_wallet_derivation_matches_uncached_walk():
+    wallet = sdk.Wallet("0" * 63 + "1")
+    digest = hmac.digest(b"Bitcoin seed", wallet.private_key_bytes, "sha512")
+    parent_key, parent_chain_code = digest[:32], digest[32:]
+    for index in sdk._DIGIBYTE_EXTERNAL_CHAIN:
+        parent_key, parent_chain_code = sdk._ckd_priv(parent_key, parent_chain_code, index)
+    for index in (0, 1, 7):
+        child_key, _ = sdk._ckd_priv(parent_key, parent_chain_code, index)
+        assert wallet.derive_private_key(index) == child_key.hex()
+
+# ========================================================================
+# 🔹 Keys & Addresses
+# ========================================================================
+KEY_ONE_HEX = "0" * 63 + "1"
+KEY_ONE_HASH160 = bytes.fromhex("751e76e8199196d454941c45d1b3a323f1433bd6")  # Compressed pubkey of key 1
+
+
+def test_base58check_matches_known_bitcoin_address():
+    assert sdk._base58check_encode(b"\x00" + KEY_ONE_HASH160) == "1BgGZ9tcN4rm9KBzDn7KprQz87SZ26SAMH"
+
+
+@pytest.mark.parametrize("message, expected", [
+    (b"", "9c1185a5c5e9fc54612808977ee8f548b2258d31"),
+    (b"abc", "8eb208f7e05d987a9b044a8e98c6b087f15a0bfc"),
+    (b"a" * 1000, "aa69deee9a8922e92f8105e007f76110f381e9cf"),
+])
+def test_pure_python_ripemd160(message, expected):
+    assert sdk._ripemd160_python(message).hex() == expected
+
+
+@requires_coincurve
+@pytest.mark.parametrize("has_openssl_ripemd160", [True, False])
+def test_wallet_address_for_known_key(monkeypatch, has_openssl_ripemd160):
+    if has_openssl_ripemd160 and not sdk._HAS_RIPEMD160:
+        pytest.skip("OpenSSL ripemd160 is unavailable")
+    monkeypatch.setattr(sdk, "_HAS_RIPEMD160", has_openssl_ripemd160)
+    assert sdk._base58check_encode(b"\x1e" + KEY_ONE_HASH160) == "DFpN6QqFfUm3gKNaxN6tNcab1FArL9cZLE"
+    assert sdk.Wallet(KEY_ONE_HEX).address == "DFpN6QqFfUm3gKNaxN6tNcab1FArL9cZLE"
+    assert sdk.Wallet("KwDiBf89QgGbjEhKnhXJuH7LrciVrZi3qYjgd9M7rFU73sVHnoWn").address == "DFpN6QqFfUm3gKNaxN6tNcab1FArL9cZLE"
+
+
+@requires_coincurve
+def test_derived_addresses_are_distinct():
+    wallet = sdk.Wallet(KEY_ONE_HEX)
+    addresses = {wallet.address, wallet.derive_address(0), wallet.derive_address(1)}
+    assert len(addresses) == 3
+    assert all(address.startswith("D") for address in addresses)
+
+
+def test_wallet_requires_coincurve(monkeypatch):
+    monkeypatch.setattr(sdk, "coincurve", None)
+    with pytest.raises(RuntimeError):
+        sdk.Wallet(KEY_ONE_HEX)
+
+
+@pytest.mark.parametrize("private_key, compressed", [
+    (KEY_ONE_HEX, True),
+    ("5HpHagT65TZzG1PH3CSu63k8DbpvD8s5ip4nEB3kEsreAnchuDf", False),
+    ("KwDiBf89QgGbjEhKnhXJuH7LrciVrZi3qYjgd9M7rFU73sVHnoWn", True),
+])
+def test_parse_private_key_formats(private_key, compressed):
+    assert sdk._parse_private_key(private_key) == (bytes.fromhex(KEY_ONE_HEX), compressed)
+
+
+@pytest.mark.parametrize("private_key", [
+    "zz" * 32,  # Not hex
+    "0" * 64,  # Outside the secp256k1 key range
+    "5HpHagT65TZzG1PH3CSu63k8DbpvD8s5ip4nEB3kEsreAnchuDe",  # Bad WIF checksum
+    "D8DerivedAddressFromKey",
+])
+def test_parse_private_key_rejects_invalid_keys(private_key):
+    with pytest.raises(ValueError):
+        sdk._parse_private_key(private_key)
+
+# ========================================================================
+# 🔹 Transaction Encoding
+# ========================================================================
+@pytest.fixture
+def tx_manager(monkeypatch):
+    monkeypatch.setattr(sdk, "_now_s", lambda: 1700000000)
+    return sdk.TransactionManager(sdk.Wallet(KEY_ONE_HEX))
+
+
+@requires_coincurve
+@pytest.mark.parametrize("to_address, amount, fee", [
+    ("DFpN6QqFfUm3gKNaxN6tNcab1FArL9cZLE", 0.1, 0.001),
+    ("DFpN6QqFfUm3gKNaxN6tNcab1FArL9cZLE", 0.123456789, 0.0010000001),
+    ("DFpN6QqFfUm3gKNaxN6tNcab1FArL9cZLE", 21000000000, 0),
+    ('needs "escaping"\n', 1e-8, 0.001),
+])
+def test_fused_payment_matches_record_encoding(tx_manager, to_address, amount, fee):
+    fused = tx_manager.build_signed_payment(to_address, amount, fee)
+    record = tx_manager.sign_transaction(tx_manager.create_transaction(to_address, amount, fee))
+    assert fused == tx_manager.encode_transaction(record)
+    wire = sdk._LOADS(fused)
+    # The node must receive exactly the amounts covered by the signature
+    signed_amount, signed_fee = record.signing_payload().decode().split("|")[2:4]
+    assert wire["amount"] == float(signed_amount)
+    assert wire["fee"] == float(signed_fee)
+
+
+@requires_coincurve
+@pytest.mark.parametrize("amount", [float("inf"), float("-inf"), float("nan")])
+def test_non_finite_amounts_are_rejected(tx_manager, amount):
+    with pytest.raises(ValueError):
+        tx_manager.build_signed_payment("DFpN6QqFfUm3gKNaxN6tNcab1FArL9cZLE", amount)
+    with pytest.raises(ValueError):
+        tx_manager.create_transaction("DFpN6QqFfUm3gKNaxN6tNcab1FArL9cZLE", 0.1, amount)
+
+# ========================================================================
+# 🔹 Broadcasting
+# ========================================================================
+@pytest.fixture
+def broadcast_node(monkeypatch):
+    """A DigiByte node stub on its own thread and loop, so it outlives the test's event loops."""
+    received = []
+    started = threading.Event()
+    state = {}
+
+    async def broadcast(request):
+        received.append(sdk._LOADS(await request.read()))
+        return web.json_response({"ok": True})
+
+    async def serve():
+        app = web.Application()
+        app.router.add_post("/broadcast", broadcast)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        state["port"] = runner.addresses[0][1]
+        state["stop"] = asyncio.Event()
+        state["loop"] = asyncio.get_running_loop()
+        started.set()
+        await state["stop"].wait()
+        await runner.cleanup()
+
+    thread = threading.Thread(target=asyncio.run, args=(serve(),), daemon=True)
+    thread.start()
+    started.wait(5)
+    monkeypatch.setattr(sdk.Config, "DIGIBYTE_API_URL", f"http://127.0.0.1:{state['port']}")
+    yield received
+    state["loop"].call_soon_threadsafe(state["stop"].set)
+    thread.join(5)
+
+
+@requires_coincurve
+def test_sdk_survives_separate_event_loops(broadcast_node):
+    client = sdk.DigiplayGamingSDK(KEY_ONE_HEX)
+    for _ in range(2):
+        # Each asyncio.run is a new loop; the SDK must not reuse the previous loop's queue and workers
+        assert asyncio.run(asyncio.wait_for(client.send_payment("DAbc", 0.1), 5)) == {"ok": True}
+
+    async def with_context():
+        async with client:
+            return await client.send_payment("DAbc", 0.2)
+
+    assert asyncio.run(asyncio.wait_for(with_context(), 5)) == {"ok": True}
+    assert [payment["amount"] for payment in broadcast_node] == [0.1, 0.1, 0.2]
+
+
+# ========================================================================
+# 🔹 Rate Limiting & Retries
+# ========================================================================
+@pytest.mark.parametrize("headers", [
+    {"X-RateLimit-Reset": "inf"},
+    {"X-RateLimit-Reset": "nan"},
+    {"X-RateLimit-Reset": "-inf"},
+])
+def test_retry_after_rejects_non_finite_headers(headers):
+    assert sdk._retry_after_seconds(headers) is None
+
+
+@pytest.mark.parametrize("headers", [
+    {"Retry-After": "86400"},
+    {"X-RateLimit-Reset": "1e300"},
+])
+def test_retry_after_is_capped(headers):
+    assert sdk._retry_after_seconds(headers) == sdk.Config.RATE_LIMIT_MAX_WAIT
+
+
+def test_retry_after_seconds_formats(monkeypatch):
+    monkeypatch.setattr(sdk.time, "time", lambda: 1700000000.0)
+    assert sdk._retry_after_seconds({"Retry-After": "7"}) == 7
+    # HTTP-date, 30 seconds after the patched clock
+    assert sdk._retry_after_seconds({"Retry-After": "Tue, 14 Nov 2023 22:13:50 GMT"}) == 30
+    assert sdk._retry_after_seconds({"X-RateLimit-Reset": "2.5"}) == 2.5  # Seconds until reset
+    assert sdk._retry_after_seconds({"X-RateLimit-Reset": "1700000012"}) == 12  # Unix timestamp
+    assert sdk._retry_after_seconds({"X-RateLimit-Reset": "1699999990"}) == 0  # Already passed
+    assert sdk._retry_after_seconds({"Retry-After": "soon", "X-RateLimit-Reset": "4"}) == 4
+    assert sdk._retry_after_seconds({}) is None
+
+
+@pytest.mark.parametrize("error, retryable", [
+    (sdk.HttpStatusError(429, "/broadcast"), True),
+    (sdk.HttpStatusError(500, "/broadcast"), True),
+    (sdk.HttpStatusError(503, "/broadcast"), True),
+    (sdk.HttpStatusError(400, "/broadcast"), False),
+    (sdk.HttpStatusError(404, "/broadcast"), False),
+    (asyncio.TimeoutError(), True),
+    (ValueError("bad body"), False),
+])
+def test_is_retryable(error, retryable):
+    assert sdk.RetryManager.is_retryable(error) is retryable
+
+
+@pytest.fixture
+def recorded_sleeps(monkeypatch):
+    """Replace asyncio.sleep with a recorder so backoff is observable without waiting."""
+    sleeps = []
+
+    async def sleep(delay, result=None):
+        sleeps.append(delay)
+        return result
+
+    monkeypatch.setattr(sdk.asyncio, "sleep", sleep)
+    monkeypatch.setattr(sdk.Config, "RETRY_BASE_DELAY", 0.5)
+    monkeypatch.setattr(sdk.Config, "RETRY_MAX_DELAY", 4)
+    monkeypatch.setattr(sdk.Config, "RETRY_JITTER", 0)
+    monkeypatch.setattr(sdk.Config, "RETRY_ATTEMPTS", 5)
+    return sleeps
+
+
+def failing_operation(*errors):
+    calls = []
+
+    async def operation():
+        calls.append(len(calls))
+        if len(calls) <= len(errors):
+            raise errors[len(calls) - 1]
+        return "ok"
+
+    return operation, calls
+
+
+def test_retry_backs_off_then_succeeds(recorded_sleeps):
+    operation, calls = failing_operation(sdk.HttpStatusError(503, "/broadcast"), asyncio.TimeoutError())
+    assert asyncio.run(sdk.RetryManager().run(operation)) == "ok"
+    assert recorded_sleeps == [0.5, 1.0]
+    assert len(calls) == 3
+
+
+def test_retry_does_not_retry_client_errors(recorded_sleeps):
+    operation, calls = failing_operation(sdk.HttpStatusError(400, "/broadcast"))
+    with pytest.raises(sdk.HttpStatusError):
+        asyncio.run(sdk.RetryManager().run(operation))
+    assert recorded_sleeps == [] and len(calls) == 1
+
+
+def test_retry_stops_at_deadline(recorded_sleeps, monkeypatch):
+    monkeypatch.setattr(sdk.Config, "RETRY_DEADLINE", 1)
+    operation, calls = failing_operation(*[sdk.HttpStatusError(503, "/broadcast")] * 5)
+    with pytest.raises(sdk.HttpStatusError):
+        asyncio.run(sdk.RetryManager().run(operation))
+    # The second backoff step (1s) would reach the 1s deadline, so only one retry happens
+    assert recorded_sleeps == [0.5] and len(calls) == 2
+
+
+def test_retry_honours_retry_after(recorded_sleeps):
+    operation, _ = failing_operation(sdk.HttpStatusError(429, "/broadcast", retry_after=3))
+    assert asyncio.run(sdk.RetryManager().run(operation)) == "ok"
+    assert recorded_sleeps == [3]
+
+
+def test_track_rate_limit_resets_stale_state():
+    async def track():
+        client = sdk.HttpClient()
+        assert client._track_rate_limit({"X-RateLimit-Remaining": "5"}, 200) is None
+        assert client.rate_limit_remaining == 5
+        # The budget is spent: the reset time becomes a resume time on the loop clock
+        assert client._track_rate_limit({"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "2"}, 200) == 2
+        assert client.rate_limit_remaining == 0
+        assert client.rate_limit_resume_at > asyncio.get_running_loop().time() + 1
+        client._track_rate_limit({}, 200)
+        assert client.rate_limit_remaining is None
+
+    asyncio.run(track())
+
+
+class FakeHttpClient:
+    """Stands in for HttpClient: answers each post with the next scripted status."""
+    def __init__(self, *statuses):
+        self.statuses = list(statuses)
+        self.closed = False
+        self.bodies = []
+
+    async def post(self, url, data, headers):
+        self.bodies.append(data)
+        status = self.statuses.pop(0)
+        if status >= 400:
+            raise sdk.HttpStatusError(status, url)
+        return b'{"txid":"abc"}'
+
+
+@requires_coincurve
+def test_broadcast_retries_server_errors(recorded_sleeps):
+    http = FakeHttpClient(503, 429, 200)
+    tx_manager = sdk.TransactionManager(sdk.Wallet(KEY_ONE_HEX), http)
+    assert asyncio.run(tx_manager.broadcast_payload(b"{}")) == {"txid": "abc"}
+    assert len(http.bodies) == 3
+
+
+@requires_coincurve
+def test_broadcast_surfaces_rejections(recorded_sleeps):
+    http = FakeHttpClient(400)
+    tx_manager = sdk.TransactionManager(sdk.Wallet(KEY_ONE_HEX), http)
+    with pytest.raises(sdk.HttpStatusError) as excinfo:
+        asyncio.run(tx_manager.broadcast_payload(b"{}"))
+    assert excinfo.value.status == 400
+
+
+# ========================================================================
+# 🔹 Event Listener
+# ========================================================================
+async def start_node(monkeypatch, events_handler):
+    """Serve `events_handler` at /events and point the SDK at it; returns (server, open HttpClient)."""
+    app = web.Application()
+    app.router.add_get("/events", events_handler)
+    server = TestServer(app)
+    await server.start_server()
+    monkeypatch.setattr(sdk.Config, "DIGIBYTE_API_URL", str(server.make_url("")).rstrip("/"))
+    monkeypatch.setattr(sdk.Config, "EVENT_RECONNECT_DELAY", 0.01)
+    http = sdk.HttpClient()
+    await http.open()
+    return server, http
+
+
+def test_listener_falls_back_to_long_polling_and_resumes_from_cursor(monkeypatch):
+    requests = []
+    batches = {None: [{"cursor": 1}, {"cursor": 2}], "2": [{"cursor": 3}]}
+
+    async def events(request):
+        if request.headers.get("Upgrade", "").lower() == "websocket":
+            return web.Response(status=404)
+        requests.append(request.query.get("since"))
+        batch = batches.get(request.query.get("since"), [])
+        if not batch:
+            await asyncio.sleep(0.05)  # An idle long-poll
+        return web.json_response(batch)
+
+    async def scenario():
+        server, http = await start_node(monkeypatch, events)
+        received = []
+        listener = sdk.BlockchainEventListener(received.append, http)
+        task = asyncio.create_task(listener.start_listening())
+        while len(received) < 3:
+            await asyncio.sleep(0.01)
+        listener.stop_listening()
+        await asyncio.wait_for(task, 1)
+        await http.close()
+        await server.close()
+        return received, listener
+
+    received, listener = asyncio.run(scenario())
+    assert [event["cursor"] for event in received] == [1, 2, 3]
+    assert requests[:2] == [None, "2"]
+    assert listener.last_seen_cursor == "3"
+
+
+def test_listener_resubscribes_websocket_from_cursor(monkeypatch):
+    subscriptions = []
+
+    async def events(request):
+        since = int(request.query.get("since", 0))
+        subscriptions.append(since)
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        await ws.send_json({"cursor": since + 1})
+        await ws.send_json([{"cursor": since + 2}, {"cursor": since + 3}])
+        await ws.close()  # Drop the stream; the listener must resume after cursor since + 3
+        return ws
+
+    async def scenario():
+        server, http = await start_node(monkeypatch, events)
+        received = []
+        listener = sdk.BlockchainEventListener(received.append, http)
+        task = asyncio.create_task(listener.start_listening())
+        while len(received) < 6:
+            await asyncio.sleep(0.01)
+        listener.stop_listening()
+        await asyncio.wait_for(task, 1)
+        await http.close()
+        await server.close()
+        return received
+
+    received = asyncio.run(scenario())
+    assert [event["cursor"] for event in received[:6]] == [1, 2, 3, 4, 5, 6]
+    assert subscriptions[:2] == [0, 3]
+
+
+def test_stop_listening_closes_an_idle_websocket(monkeypatch):
+    connected = []
+
+    async def events(request):
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        connected.append(True)
+        async for _ in ws:  # Never sends anything; only the client can end this subscription
+            pass
+        return ws
+
+    async def scenario():
+        server, http = await start_node(monkeypatch, events)
+        listener = sdk.BlockchainEventListener(lambda event: None, http)
+        task = asyncio.create_task(listener.start_listening())
+        while not connected:
+            await asyncio.sleep(0.01)
+        listener.stop_listening()
+        # Must finish on its own, without the task being cancelled
+        await asyncio.wait_for(asyncio.shield(task), 1)
+        await http.close()
+        await server.close()
+        return task
+
+    task = asyncio.run(scenario())
+    assert task.done() and not task.cancelled()
+    assert len(connected) == 1
+
+
+def test_failing_callback_keeps_the_subscription(monkeypatch):
+    subscriptions = []
+
+    async def events(request):
+        subscriptions.append(request.query.get("since"))
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        await ws.send_json([{"cursor": 1}, {"cursor": 2}])
+        await ws.send_json({"cursor": 3})
+        async for _ in ws:
+            pass
+        return ws
+
+    async def scenario():
+        server, http = await start_node(monkeypatch, events)
+        received = []
+
+        async def callback(event):
+            received.append(event["cursor"])
+            if event["cursor"] == 1:
+                raise RuntimeError("game handler bug")
+
+        listener = sdk.BlockchainEventListener(callback, http)
+        task = asyncio.create_task(listener.start_listening())
+        while len(received) < 3:
+            await asyncio.sleep(0.01)
+        listener.stop_listening()
+        await asyncio.wait_for(task, 1)
+        await http.close()
+        await server.close()
+        return received, listener
+
+    received, listener = asyncio.run(scenario())
+    assert received == [1, 2, 3]
+    assert subscriptions == [None]
+    assert listener.last_seen_cursor == "3"